@@ -68,26 +68,26 @@ class StepType(Enum):
 class InferenceStep(StepCommon):
     model_config = ConfigDict(protected_namespaces=())
 
-    step_type: Literal[StepType.inference.value] = StepType.inference.value
+    step_type: Literal["inference"] = "inference"
     model_response: CompletionMessage
 
 
 @json_schema_type
 class ToolExecutionStep(StepCommon):
-    step_type: Literal[StepType.tool_execution.value] = StepType.tool_execution.value
+    step_type: Literal["tool_execution"] = "tool_execution"
     tool_calls: List[ToolCall]
     tool_responses: List[ToolResponse]
 
 
 @json_schema_type
 class ShieldCallStep(StepCommon):
-    step_type: Literal[StepType.shield_call.value] = StepType.shield_call.value
+    step_type: Literal["shield_call"] = "shield_call"
     violation: Optional[SafetyViolation]
 
 
 @json_schema_type
 class MemoryRetrievalStep(StepCommon):
-    step_type: Literal[StepType.memory_retrieval.value] = StepType.memory_retrieval.value
+    step_type: Literal["memory_retrieval"] = "memory_retrieval"
     vector_db_ids: str
     inserted_context: InterleavedContent
 
@@ -196,7 +196,9 @@ class AgentTurnResponseEventType(Enum):
 
 @json_schema_type
 class AgentTurnResponseStepStartPayload(BaseModel):
-    event_type: Literal[AgentTurnResponseEventType.step_start.value] = AgentTurnResponseEventType.step_start.value
+    model_config = ConfigDict(frozen=True)
+
+    event_type: Literal["step_start"] = "step_start"
     step_type: StepType
     step_id: str
     metadata: Optional[Dict[str, Any]] = Field(default_factory=dict)
@@ -204,7 +206,9 @@ class AgentTurnResponseStepStartPayload(BaseModel):
 
 @json_schema_type
 class AgentTurnResponseStepCompletePayload(BaseModel):
-    event_type: Literal[AgentTurnResponseEventType.step_complete.value] = AgentTurnResponseEventType.step_complete.value
+    model_config = ConfigDict(frozen=True)
+
+    event_type: Literal["step_complete"] = "step_complete"
     step_type: StepType
     step_id: str
     step_details: Step
@@ -212,9 +216,9 @@ class AgentTurnResponseStepCompletePayload(BaseModel):
 
 @json_schema_type
 class AgentTurnResponseStepProgressPayload(BaseModel):
-    model_config = ConfigDict(protected_namespaces=())
+    model_config = ConfigDict(frozen=True, protected_namespaces=())
 
-    event_type: Literal[AgentTurnResponseEventType.step_progress.value] = AgentTurnResponseEventType.step_progress.value
+    event_type: Literal["step_progress"] = "step_progress"
     step_type: StepType
     step_id: str
 
@@ -223,13 +227,17 @@ class AgentTurnResponseStepProgressPayload(BaseModel):
 
 @json_schema_type
 class AgentTurnResponseTurnStartPayload(BaseModel):
-    event_type: Literal[AgentTurnResponseEventType.turn_start.value] = AgentTurnResponseEventType.turn_start.value
+    model_config = ConfigDict(frozen=True)
+
+    event_type: Literal["turn_start"] = "turn_start"
     turn_id: str
 
 
 @json_schema_type
 class AgentTurnResponseTurnCompletePayload(BaseModel):
-    event_type: Literal[AgentTurnResponseEventType.turn_complete.value] = AgentTurnResponseEventType.turn_complete.value
+    model_config = ConfigDict(frozen=True)
+
+    event_type: Literal["turn_complete"] = "turn_complete"
     turn: Turn
 
 
@@ -18,7 +18,7 @@ from typing import (
 )
 
 from llama_models.schema_utils import json_schema_type, register_schema, webmethod
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from typing_extensions import Annotated
 
 # Add this constant near the top of the file, after the imports
@@ -39,11 +39,9 @@ class Span(BaseModel):
     name: str
     start_time: datetime
     end_time: Optional[datetime] = None
-    attributes: Optional[Dict[str, Any]] = Field(default_factory=dict)
+    attributes: Dict[str, Any] = Field(default_factory=dict)
 
     def set_attribute(self, key: str, value: Any):
-        if self.attributes is None:
-            self.attributes = {}
         self.attributes[key] = value
 
 
@@ -76,19 +74,19 @@ class EventCommon(BaseModel):
     trace_id: str
     span_id: str
     timestamp: datetime
-    attributes: Optional[Dict[str, Any]] = Field(default_factory=dict)
+    attributes: Dict[str, Any] = Field(default_factory=dict)
 
 
 @json_schema_type
 class UnstructuredLogEvent(EventCommon):
-    type: Literal[EventType.UNSTRUCTURED_LOG.value] = EventType.UNSTRUCTURED_LOG.value
+    type: Literal["unstructured_log"] = "unstructured_log"
     message: str
     severity: LogSeverity
 
 
 @json_schema_type
 class MetricEvent(EventCommon):
-    type: Literal[EventType.METRIC.value] = EventType.METRIC.value
+    type: Literal["metric"] = "metric"
     metric: str  # this would be an enum
     value: Union[int, float]
     unit: str
@@ -102,14 +100,18 @@ class StructuredLogType(Enum):
 
 @json_schema_type
 class SpanStartPayload(BaseModel):
-    type: Literal[StructuredLogType.SPAN_START.value] = StructuredLogType.SPAN_START.value
+    model_config = ConfigDict(frozen=True)
+
+    type: Literal["span_start"] = "span_start"
     name: str
     parent_span_id: Optional[str] = None
 
 
 @json_schema_type
 class SpanEndPayload(BaseModel):
-    type: Literal[StructuredLogType.SPAN_END.value] = StructuredLogType.SPAN_END.value
+    model_config = ConfigDict(frozen=True)
+
+    type: Literal["span_end"] = "span_end"
     status: SpanStatus
 
 
@@ -127,7 +129,7 @@ StructuredLogPayload = register_schema(
 
 @json_schema_type
 class StructuredLogEvent(EventCommon):
-    type: Literal[EventType.STRUCTURED_LOG.value] = EventType.STRUCTURED_LOG.value
+    type: Literal["structured_log"] = "structured_log"
     payload: StructuredLogPayload
 
 
@@ -7,7 +7,6 @@
 from datetime import datetime
 
 import pytest
-import yaml
 from llama_stack.distribution.configure import (
     LLAMA_STACK_RUN_CONFIG_VERSION,
     parse_and_maybe_upgrade_config,
@@ -16,83 +15,99 @@ from llama_stack.distribution.configure import (
 
 @pytest.fixture
 def up_to_date_config():
-    return yaml.safe_load(
-        """
-        version: {version}
-        image_name: foo
-        apis_to_serve: []
-        built_at: {built_at}
-        providers:
-          inference:
-            - provider_id: provider1
-              provider_type: inline::meta-reference
-              config: {{}}
-          safety:
-            - provider_id: provider1
-              provider_type: inline::meta-reference
-              config:
-                llama_guard_shield:
-                  model: Llama-Guard-3-1B
-                  excluded_categories: []
-                  disable_input_check: false
-                  disable_output_check: false
-                enable_prompt_guard: false
-          memory:
-            - provider_id: provider1
-              provider_type: inline::meta-reference
-              config: {{}}
-    """.format(version=LLAMA_STACK_RUN_CONFIG_VERSION, built_at=datetime.now().isoformat())
-    )
+    return {
+        "version": LLAMA_STACK_RUN_CONFIG_VERSION,
+        "image_name": "foo",
+        "apis_to_serve": [],
+        "built_at": datetime.now().isoformat(),
+        "providers": {
+            "inference": [
+                {
+                    "provider_id": "provider1",
+                    "provider_type": "inline::meta-reference",
+                    "config": {},
+                }
+            ],
+            "safety": [
+                {
+                    "provider_id": "provider1",
+                    "provider_type": "inline::meta-reference",
+                    "config": {
+                        "llama_guard_shield": {
+                            "model": "Llama-Guard-3-1B",
+                            "excluded_categories": [],
+                            "disable_input_check": False,
+                            "disable_output_check": False,
+                        },
+                        "enable_prompt_guard": False,
+                    },
+                }
+            ],
+            "memory": [
+                {
+                    "provider_id": "provider1",
+                    "provider_type": "inline::meta-reference",
+                    "config": {},
+                }
+            ],
+        },
+    }
 
 
 @pytest.fixture
 def old_config():
-    return yaml.safe_load(
-        """
-        image_name: foo
-        built_at: {built_at}
-        apis_to_serve: []
-        routing_table:
-          inference:
-            - provider_type: remote::ollama
-              config:
-                host: localhost
-                port: 11434
-              routing_key: Llama3.2-1B-Instruct
-            - provider_type: inline::meta-reference
-              config:
-                model: Llama3.1-8B-Instruct
-              routing_key: Llama3.1-8B-Instruct
-          safety:
-            - routing_key: ["shield1", "shield2"]
-              provider_type: inline::meta-reference
-              config:
-                llama_guard_shield:
-                  model: Llama-Guard-3-1B
-                  excluded_categories: []
-                  disable_input_check: false
-                  disable_output_check: false
-                enable_prompt_guard: false
-          memory:
-            - routing_key: vector
-              provider_type: inline::meta-reference
-              config: {{}}
-        api_providers:
-          telemetry:
-            provider_type: noop
-            config: {{}}
-    """.format(built_at=datetime.now().isoformat())
-    )
+    return {
+        "image_name": "foo",
+        "built_at": datetime.now().isoformat(),
+        "apis_to_serve": [],
+        "routing_table": {
+            "inference": [
+                {
+                    "provider_type": "remote::ollama",
+                    "config": {"host": "localhost", "port": 11434},
+                    "routing_key": "Llama3.2-1B-Instruct",
+                },
+                {
+                    "provider_type": "inline::meta-reference",
+                    "config": {"model": "Llama3.1-8B-Instruct"},
+                    "routing_key": "Llama3.1-8B-Instruct",
+                },
+            ],
+            "safety": [
+                {
+                    "routing_key": ["shield1", "shield2"],
+                    "provider_type": "inline::meta-reference",
+                    "config": {
+                        "llama_guard_shield": {
+                            "model": "Llama-Guard-3-1B",
+                            "excluded_categories": [],
+                            "disable_input_check": False,
+                            "disable_output_check": False,
+                        },
+                        "enable_prompt_guard": False,
+                    },
+                }
+            ],
+            "memory": [
+                {
+                    "routing_key": "vector",
+                    "provider_type": "inline::meta-reference",
+                    "config": {},
+                }
+            ],
+        },
+        "api_providers": {
+            "telemetry": {"provider_type": "noop", "config": {}},
+        },
+    }
 
 
 @pytest.fixture
 def invalid_config():
-    return yaml.safe_load(
-        """
-        routing_table: {}
-        api_providers: {}
-    """
-    )
+    return {
+        "routing_table": {},
+        "api_providers": {},
+    }
 
 
 def test_parse_and_maybe_upgrade_config_up_to_date(up_to_date_config):
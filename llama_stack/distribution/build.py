@@ -6,6 +6,7 @@
 
 import importlib.resources
 import logging
+import re
 import sys
 from enum import Enum
 
@@ -17,8 +18,6 @@ from termcolor import cprint
 
 from llama_stack.distribution.datatypes import BuildConfig, Provider
 
-from llama_stack.distribution.distribution import get_provider_registry
-
 from llama_stack.distribution.utils.config_dirs import BUILDS_BASE_DIR
 
 from llama_stack.distribution.utils.exec import run_command, run_with_pty
@@ -37,6 +36,10 @@ SERVER_DEPENDENCIES = [
 ]
 
 
+# Pip flags that mark a dependency as needing its own `pip install` invocation.
+_SPECIAL_DEP_RE = re.compile(r"--(?:no-deps|index-url)")
+
+
 class ImageType(Enum):
     container = "container"
     conda = "conda"
@@ -52,6 +55,10 @@ def get_provider_dependencies(
     config_providers: Dict[str, List[Provider]],
 ) -> tuple[list[str], list[str]]:
     """Get normal and special dependencies from provider configuration."""
+    # Imported lazily: building the provider registry imports every provider
+    # module, which is far too heavy for CLI paths that never resolve deps.
+    from llama_stack.distribution.distribution import get_provider_registry
+
     all_providers = get_provider_registry()
     deps = []
 
@@ -75,12 +82,14 @@ def get_provider_dependencies(
     normal_deps = []
     special_deps = []
     for package in deps:
-        if "--no-deps" in package or "--index-url" in package:
+        if _SPECIAL_DEP_RE.search(package):
             special_deps.append(package)
         else:
             normal_deps.append(package)
 
-    return list(set(normal_deps)), list(set(special_deps))
+    # dict.fromkeys dedupes while keeping insertion order, so the generated pip
+    # commands are deterministic across builds.
+    return list(dict.fromkeys(normal_deps)), list(dict.fromkeys(special_deps))
 
 
 def print_pip_install_help(providers: Dict[str, List[Provider]]):
@@ -101,6 +110,9 @@ def build_image(
     image_name: str,
     template_or_config: str,
 ):
+    # The conda/venv scripts resolve every dependency through `uv pip install`
+    # (single resolver process, shared download cache); only container builds
+    # still drive pip inside the image.
     container_base = build_config.distribution_spec.container_image or "python:3.10-slim"
 
     normal_deps, special_deps = get_provider_dependencies(build_config.distribution_spec.providers)
@@ -9,10 +9,11 @@ import inspect
 import json
 from collections.abc import AsyncIterator
 from enum import Enum
+from functools import lru_cache
 from typing import Any, get_args, get_origin, Type, Union
 
 import httpx
-from pydantic import BaseModel, parse_obj_as
+from pydantic import BaseModel, TypeAdapter
 from termcolor import cprint
 
 from llama_stack.apis.version import LLAMA_STACK_API_VERSION
@@ -22,6 +23,13 @@ from llama_stack.providers.datatypes import RemoteProviderConfig
 _CLIENT_CLASSES = {}
 
 
+@lru_cache(maxsize=None)
+def _type_adapter(type_: Any) -> TypeAdapter:
+    # Building a TypeAdapter compiles the pydantic-core schema; cache it per
+    # return type so streaming responses don't recompile once per chunk.
+    return TypeAdapter(type_)
+
+
 async def get_client_impl(protocol, config: RemoteProviderConfig, _deps: Any):
     client_class = create_api_client_class(protocol)
     impl = client_class(config.url)
@@ -38,6 +46,9 @@ def create_api_client_class(protocol) -> Type:
             print(f"({protocol.__name__}) Connecting to {base_url}")
             self.base_url = base_url.rstrip("/")
             self.routes = {}
+            # One connection pool per client; opening a fresh AsyncClient per
+            # request paid TCP/TLS setup on every call.
+            self.client = httpx.AsyncClient()
 
             # Store routes for this protocol
             for name, method in inspect.getmembers(protocol):
@@ -49,7 +60,7 @@ def create_api_client_class(protocol) -> Type:
             pass
 
         async def shutdown(self):
-            pass
+            await self.client.aclose()
 
         async def __acall__(self, method_name: str, *args, **kwargs) -> Any:
             assert method_name in self.routes, f"Unknown endpoint: {method_name}"
@@ -70,16 +81,15 @@ def create_api_client_class(protocol) -> Type:
                 return_type = extract_non_async_iterator_type(sig.return_annotation)
                 assert return_type, f"Could not extract return type for {sig.return_annotation}"
 
-            async with httpx.AsyncClient() as client:
-                params = self.httpx_request_params(method_name, *args, **kwargs)
-                response = await client.request(**params)
-                response.raise_for_status()
+            params = self.httpx_request_params(method_name, *args, **kwargs)
+            response = await self.client.request(**params)
+            response.raise_for_status()
 
-                j = response.json()
-                if j is None:
-                    return None
-                # print(f"({protocol.__name__}) Returning {j}, type {return_type}")
-                return parse_obj_as(return_type, j)
+            j = response.json()
+            if j is None:
+                return None
+            # print(f"({protocol.__name__}) Returning {j}, type {return_type}")
+            return _type_adapter(return_type).validate_python(j)
 
         async def _call_streaming(self, method_name: str, *args, **kwargs) -> Any:
             webmethod, sig = self.routes[method_name]
@@ -87,24 +97,23 @@ def create_api_client_class(protocol) -> Type:
             return_type = extract_async_iterator_type(sig.return_annotation)
             assert return_type, f"Could not extract return type for {sig.return_annotation}"
 
-            async with httpx.AsyncClient() as client:
-                params = self.httpx_request_params(method_name, *args, **kwargs)
-                async with client.stream(**params) as response:
-                    response.raise_for_status()
-
-                    async for line in response.aiter_lines():
-                        if line.startswith("data:"):
-                            data = line[len("data: ") :]
-                            try:
-                                data = json.loads(data)
-                                if "error" in data:
-                                    cprint(data, "red")
-                                    continue
-
-                                yield parse_obj_as(return_type, data)
-                            except Exception as e:
-                                print(f"Error with parsing or validation: {e}")
-                                print(data)
+            params = self.httpx_request_params(method_name, *args, **kwargs)
+            async with self.client.stream(**params) as response:
+                response.raise_for_status()
+
+                async for line in response.aiter_lines():
+                    if line.startswith("data:"):
+                        data = line[len("data: ") :]
+                        try:
+                            data = json.loads(data)
+                            if "error" in data:
+                                cprint(data, "red")
+                                continue
+
+                            yield _type_adapter(return_type).validate_python(data)
+                        except Exception as e:
+                            print(f"Error with parsing or validation: {e}")
+                            print(data)
 
         def httpx_request_params(self, method_name: str, *args, **kwargs) -> dict:
             webmethod, sig = self.routes[method_name]
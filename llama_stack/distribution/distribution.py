@@ -5,6 +5,7 @@
 # the root directory of this source tree.
 
 import importlib
+from functools import lru_cache
 from typing import Dict, List
 
 from pydantic import BaseModel
@@ -59,6 +60,7 @@ def providable_apis() -> List[Api]:
     return [api for api in Api if api not in routing_table_apis and api != Api.inspect]
 
 
+@lru_cache
 def get_provider_registry() -> Dict[Api, Dict[str, ProviderSpec]]:
     ret = {}
     for api in providable_apis():
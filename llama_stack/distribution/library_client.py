@@ -12,6 +12,7 @@ import os
 import re
 from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, get_args, get_origin, Optional, TypeVar
 
@@ -50,6 +51,15 @@ from llama_stack.providers.utils.telemetry.tracing import (
 T = TypeVar("T")
 
 
+@lru_cache(maxsize=None)
+def _type_adapter(annotation: Any) -> TypeAdapter:
+    # TypeAdapter construction compiles a pydantic-core schema for the
+    # annotation; cache one adapter per annotation so request payloads (for
+    # example the discriminated Event union) validate through the already
+    # compiled schema instead of rebuilding it on every call.
+    return TypeAdapter(annotation)
+
+
 def in_notebook():
     try:
         from IPython import get_ipython
@@ -99,7 +109,7 @@ def convert_to_pydantic(annotation: Any, value: Any) -> Any:
 
     try:
         # Handle Pydantic models and discriminated unions
-        return TypeAdapter(annotation).validate_python(value)
+        return _type_adapter(annotation).validate_python(value)
     except Exception as e:
         cprint(
             f"Warning: direct client failed to convert parameter {value} into {annotation}: {e}",
@@ -43,13 +43,15 @@ def _get_registry_key_range() -> Tuple[str, str]:
     return start_key, f"{start_key}\xff"
 
 
+# Building a TypeAdapter compiles a fresh pydantic-core schema for the whole
+# RoutableObjectWithProvider union; construct it once and reuse it for every
+# registry read.
+_ROUTABLE_OBJECT_ADAPTER = pydantic.TypeAdapter(RoutableObjectWithProvider)
+
+
 def _parse_registry_values(values: List[str]) -> List[RoutableObjectWithProvider]:
     """Utility function to parse registry values into RoutableObjectWithProvider objects."""
-    all_objects = []
-    for value in values:
-        obj = pydantic.TypeAdapter(RoutableObjectWithProvider).validate_json(value)
-        all_objects.append(obj)
-    return all_objects
+    return [_ROUTABLE_OBJECT_ADAPTER.validate_json(value) for value in values]
 
 
 class DiskDistributionRegistry(DistributionRegistry):
@@ -73,7 +75,7 @@ class DiskDistributionRegistry(DistributionRegistry):
         if not json_str:
             return None
 
-        return pydantic.TypeAdapter(RoutableObjectWithProvider).validate_json(json_str)
+        return _ROUTABLE_OBJECT_ADAPTER.validate_json(json_str)
 
     async def update(self, obj: RoutableObjectWithProvider) -> None:
         await self.kvstore.set(
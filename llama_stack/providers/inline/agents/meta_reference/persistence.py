@@ -4,7 +4,6 @@
 # This source code is licensed under the terms described in the LICENSE file in
 # the root directory of this source tree.
 
-import json
 import logging
 import uuid
 from datetime import datetime
@@ -50,7 +49,7 @@ class AgentPersistence:
         if not value:
             return None
 
-        return AgentSessionInfo(**json.loads(value))
+        return AgentSessionInfo.model_validate_json(value)
 
     async def add_vector_db_to_session(self, session_id: str, vector_db_id: str):
         session_info = await self.get_session_info(session_id)
@@ -77,7 +76,7 @@ class AgentPersistence:
         turns = []
         for value in values:
             try:
-                turn = Turn(**json.loads(value))
+                turn = Turn.model_validate_json(value)
                 turns.append(turn)
             except Exception as e:
                 log.error(f"Error parsing turn: {e}")
@@ -3,9 +3,12 @@
 #
 # This source code is licensed under the terms described in the LICENSE file in
 # the root directory of this source tree.
+import asyncio
+import itertools
 from typing import Any, Dict, List, Optional
 
 from tqdm import tqdm
+from tqdm.asyncio import tqdm_asyncio
 
 from llama_stack.apis.agents import Agents, StepType
 from llama_stack.apis.datasetio import DatasetIO
@@ -33,6 +36,13 @@ from .config import MetaReferenceEvalConfig
 
 EVAL_TASKS_PREFIX = "eval_tasks:"
 
+# Upper bound on in-flight inference requests issued by a single evaluation.
+MAX_CONCURRENT_GENERATIONS = 16
+
+# Page size used when walking a whole dataset; keeps each datasetio response
+# bounded instead of asking the backend for every row in one shot.
+DATASET_FETCH_PAGE_SIZE = 500
+
 
 class MetaReferenceEvalImpl(
     Eval,
@@ -56,9 +66,18 @@ class MetaReferenceEvalImpl(
 
         # TODO: assume sync job, will need jobs API for async scheduling
         self.jobs = {}
+        # Monotonic job-id source; unlike len(self.jobs) it cannot hand the
+        # same id to two interleaved run_eval calls.
+        self._job_id_counter = itertools.count()
 
         self.eval_tasks = {}
 
+        # Dataset ids whose schema has already been validated; saves a
+        # datasets_api round trip on every subsequent run against the same
+        # dataset. A dataset re-registered under the same id mid-process will
+        # skip re-validation and fail later at scoring instead.
+        self._validated_dataset_ids = set()
+
     async def initialize(self) -> None:
         self.kvstore = await kvstore_impl(self.config.kvstore)
         # Load existing eval_tasks from kvstore
@@ -90,22 +109,42 @@ class MetaReferenceEvalImpl(
         dataset_id = task_def.dataset_id
         candidate = task_config.eval_candidate
         scoring_functions = task_def.scoring_functions
-        dataset_def = await self.datasets_api.get_dataset(dataset_id=dataset_id)
-        validate_dataset_schema(dataset_def.dataset_schema, get_valid_schemas(Api.eval.value))
-        all_rows = await self.datasetio_api.get_rows_paginated(
-            dataset_id=dataset_id,
-            rows_in_page=(-1 if task_config.num_examples is None else task_config.num_examples),
-        )
+        if dataset_id not in self._validated_dataset_ids:
+            dataset_def = await self.datasets_api.get_dataset(dataset_id=dataset_id)
+            validate_dataset_schema(dataset_def.dataset_schema, get_valid_schemas(Api.eval.value))
+            self._validated_dataset_ids.add(dataset_id)
+        if task_config.num_examples is not None:
+            all_rows = await self.datasetio_api.get_rows_paginated(
+                dataset_id=dataset_id,
+                rows_in_page=task_config.num_examples,
+            )
+            input_rows = all_rows.rows
+        else:
+            # Walk the dataset page by page rather than requesting every row
+            # in a single unbounded (-1) response.
+            input_rows = []
+            page_token = None
+            while True:
+                page = await self.datasetio_api.get_rows_paginated(
+                    dataset_id=dataset_id,
+                    rows_in_page=DATASET_FETCH_PAGE_SIZE,
+                    page_token=page_token,
+                )
+                input_rows.extend(page.rows)
+                page_token = page.next_page_token
+                if not page.rows or not page_token:
+                    break
+
         res = await self.evaluate_rows(
             task_id=task_id,
-            input_rows=all_rows.rows,
+            input_rows=input_rows,
             scoring_functions=scoring_functions,
             task_config=task_config,
         )
 
         # TODO: currently needs to wait for generation before returning
         # need job scheduler queue (ray/celery) w/ jobs api
-        job_id = str(len(self.jobs))
+        job_id = str(next(self._job_id_counter))
         self.jobs[job_id] = res
         return Job(job_id=job_id)
 
@@ -158,34 +197,58 @@ class MetaReferenceEvalImpl(
         candidate = task_config.eval_candidate
         assert candidate.sampling_params.max_tokens is not None, "SamplingParams.max_tokens must be provided"
 
-        generations = []
-        for x in tqdm(input_rows):
+        # Fire the per-row completions concurrently (bounded, so we don't
+        # overwhelm the inference backend); gather preserves input order.
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_GENERATIONS)
+
+        # The system prefix is identical for every row; build it once.
+        base_messages = [candidate.system_message] if candidate.system_message else []
+
+        async def generate_one(x: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                if ColumnName.completion_input.value in x:
+                    input_content = eval(str(x[ColumnName.completion_input.value]))
+                    response = await self.inference_api.completion(
+                        model=candidate.model,
+                        content=input_content,
+                        sampling_params=candidate.sampling_params,
+                    )
+                    return {ColumnName.generated_answer.value: response.completion_message.content}
+                elif ColumnName.chat_completion_input.value in x:
+                    chat_completion_input_str = str(x[ColumnName.chat_completion_input.value])
+                    input_messages = eval(chat_completion_input_str)
+                    input_messages = [UserMessage(**x) for x in input_messages]
+                    messages = base_messages + input_messages
+                    response = await self.inference_api.chat_completion(
+                        model_id=candidate.model,
+                        messages=messages,
+                        sampling_params=candidate.sampling_params,
+                    )
+                    return {ColumnName.generated_answer.value: response.completion_message.content}
+                else:
+                    raise ValueError("Invalid input row")
+
+        strategy = candidate.sampling_params.strategy
+        if getattr(strategy, "type", None) != "greedy":
+            return await tqdm_asyncio.gather(*(generate_one(x) for x in input_rows))
+
+        # Greedy decoding is deterministic, so identical inputs (few-shot
+        # exemplars, repeated canary questions) can share one inference call;
+        # the result is broadcast back to every duplicate row.
+        def generation_key(x: Dict[str, Any]) -> str:
             if ColumnName.completion_input.value in x:
-                input_content = eval(str(x[ColumnName.completion_input.value]))
-                response = await self.inference_api.completion(
-                    model=candidate.model,
-                    content=input_content,
-                    sampling_params=candidate.sampling_params,
-                )
-                generations.append({ColumnName.generated_answer.value: response.completion_message.content})
-            elif ColumnName.chat_completion_input.value in x:
-                chat_completion_input_str = str(x[ColumnName.chat_completion_input.value])
-                input_messages = eval(chat_completion_input_str)
-                input_messages = [UserMessage(**x) for x in input_messages]
-                messages = []
-                if candidate.system_message:
-                    messages.append(candidate.system_message)
-                messages += input_messages
-                response = await self.inference_api.chat_completion(
-                    model_id=candidate.model,
-                    messages=messages,
-                    sampling_params=candidate.sampling_params,
-                )
-                generations.append({ColumnName.generated_answer.value: response.completion_message.content})
-            else:
-                raise ValueError("Invalid input row")
-
-        return generations
+                return f"completion:{x[ColumnName.completion_input.value]}"
+            return f"chat_completion:{x.get(ColumnName.chat_completion_input.value)}"
+
+        unique_generations: Dict[str, asyncio.Future] = {}
+        for x in input_rows:
+            key = generation_key(x)
+            if key not in unique_generations:
+                unique_generations[key] = asyncio.ensure_future(generate_one(x))
+
+        results = await tqdm_asyncio.gather(*unique_generations.values())
+        generation_by_key = dict(zip(unique_generations.keys(), results))
+        return [generation_by_key[generation_key(x)] for x in input_rows]
 
     async def evaluate_rows(
         self,
@@ -4,7 +4,7 @@
 # This source code is licensed under the terms described in the LICENSE file in
 # the root directory of this source tree.
 
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, field_validator
 
@@ -60,6 +60,11 @@ class MetaReferenceInferenceConfig(BaseModel):
 class MetaReferenceQuantizedInferenceConfig(MetaReferenceInferenceConfig):
     quantization: QuantizationConfig
 
+    # Transformer block ids to keep in BF16 when quantizing to FP8. When not
+    # set, the first and last blocks (the most accuracy-sensitive ones) are
+    # skipped; pass an empty list to quantize every block.
+    fp8_skip_layers: Optional[List[int]] = None
+
     @classmethod
     def sample_run_config(
         cls,
@@ -6,6 +6,8 @@
 
 import asyncio
 import logging
+import threading
+import time
 from typing import AsyncGenerator, List, Optional, Union
 
 from llama_models.llama3.api.datatypes import (
@@ -64,6 +66,65 @@ log = logging.getLogger(__name__)
 # we don't support multiple concurrent requests to this process.
 SEMAPHORE = asyncio.Semaphore(1)
 
+# When streaming a chat completion, coalesce up to this many token deltas into
+# a single stream chunk so we don't pay pydantic construction + serialization
+# for every generated token. A partial batch is never held back longer than
+# the flush interval, which keeps time-to-next-token unaffected for slow
+# generations.
+STREAM_DELTA_BATCH_SIZE = 8
+STREAM_DELTA_FLUSH_INTERVAL_SECONDS = 0.05
+
+_END_OF_STREAM = object()
+
+
+async def stream_in_executor(sync_generator) -> AsyncGenerator:
+    """Drive a blocking (GPU-bound) generator on an executor thread.
+
+    Iterating the generator directly inside an async function blocks the event
+    loop for the duration of every token sample, starving HTTP writes and any
+    other requests being served. Instead, pump it on a worker thread and relay
+    results through an asyncio.Queue. The queue is unbounded, but it holds at
+    most one generation's worth of token results; leaving the producer
+    unthrottled also lets it sample token N+1 while the event loop is still
+    serializing token N.
+    """
+    loop = asyncio.get_running_loop()
+    queue: asyncio.Queue = asyncio.Queue()
+    # Set when the consumer goes away (client disconnect, aclose, error) so
+    # the pump stops generation instead of running to exhaustion — in the
+    # distributed case that would keep SEMAPHORE held for the full
+    # generation, stalling every other request.
+    stop = threading.Event()
+
+    def pump():
+        try:
+            try:
+                for item in sync_generator:
+                    if stop.is_set():
+                        break
+                    loop.call_soon_threadsafe(queue.put_nowait, item)
+            finally:
+                # close on the pump thread, where the generator is suspended,
+                # so GeneratorExit propagates through the generator chain
+                sync_generator.close()
+        except BaseException as e:
+            loop.call_soon_threadsafe(queue.put_nowait, e)
+            return
+        loop.call_soon_threadsafe(queue.put_nowait, _END_OF_STREAM)
+
+    future = loop.run_in_executor(None, pump)
+    try:
+        while True:
+            item = await queue.get()
+            if item is _END_OF_STREAM:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        stop.set()
+        await future
+
 
 class MetaReferenceInferenceImpl(
     SentenceTransformerEmbeddingMixin,
@@ -86,6 +147,14 @@ class MetaReferenceInferenceImpl(
         else:
             self.generator = Llama.build(self.config, model_id, llama_model)
 
+        # Resolve the special-token ids once so the generation loops can make
+        # control decisions with integer comparisons instead of comparing the
+        # decoded text of every token.
+        special_tokens = self.generator.formatter.tokenizer.special_tokens
+        self._python_tag_id = special_tokens["<|python_tag|>"]
+        self._eot_id = special_tokens["<|eot_id|>"]
+        self._eom_id = special_tokens["<|eom_id|>"]
+
         self.model_id = model_id
         self.llama_model = llama_model
 
@@ -167,10 +236,10 @@ class MetaReferenceInferenceImpl(
             stop_reason = None
 
             for token_result in self.generator.completion(request):
-                if token_result.text == "<|eot_id|>":
+                if token_result.token == self._eot_id:
                     stop_reason = StopReason.end_of_turn
                     text = ""
-                elif token_result.text == "<|eom_id|>":
+                elif token_result.token == self._eom_id:
                     stop_reason = StopReason.end_of_message
                     text = ""
                 else:
@@ -197,10 +266,10 @@ class MetaReferenceInferenceImpl(
 
         if self.config.create_distributed_process_group:
             async with SEMAPHORE:
-                for x in impl():
+                async for x in stream_in_executor(impl()):
                     yield x
         else:
-            for x in impl():
+            async for x in stream_in_executor(impl()):
                 yield x
 
     async def _nonstream_completion(self, request: CompletionRequest) -> CompletionResponse:
@@ -212,9 +281,9 @@ class MetaReferenceInferenceImpl(
             tokenizer = self.generator.formatter.tokenizer
             for token_result in self.generator.completion(request):
                 tokens.append(token_result.token)
-                if token_result.text == "<|eot_id|>":
+                if token_result.token == self._eot_id:
                     stop_reason = StopReason.end_of_turn
-                elif token_result.text == "<|eom_id|>":
+                elif token_result.token == self._eom_id:
                     stop_reason = StopReason.end_of_message
 
                 if request.logprobs:
@@ -294,9 +363,9 @@ class MetaReferenceInferenceImpl(
             for token_result in self.generator.chat_completion(request):
                 tokens.append(token_result.token)
 
-                if token_result.text == "<|eot_id|>":
+                if token_result.token == self._eot_id:
                     stop_reason = StopReason.end_of_turn
-                elif token_result.text == "<|eom_id|>":
+                elif token_result.token == self._eom_id:
                     stop_reason = StopReason.end_of_message
 
                 if request.logprobs:
@@ -333,14 +402,46 @@ class MetaReferenceInferenceImpl(
             )
 
             tokens = []
-            logprobs = []
             stop_reason = None
             ipython = False
 
+            # Coalesce per-token deltas into batched progress chunks; deltas
+            # are plain text (or tool-call fragments), so concatenating them
+            # is transparent to stream consumers.
+            pending: List[str] = []
+            pending_logprobs: List[TokenLogProbs] = []
+            last_flush = time.monotonic()
+
+            def flush_chunk() -> ChatCompletionResponseStreamChunk:
+                nonlocal last_flush
+                text = "".join(pending)
+                if ipython:
+                    delta = ToolCallDelta(
+                        tool_call=text,
+                        parse_status=ToolCallParseStatus.in_progress,
+                    )
+                else:
+                    delta = TextDelta(text=text)
+                chunk = ChatCompletionResponseStreamChunk(
+                    event=ChatCompletionResponseEvent(
+                        event_type=ChatCompletionResponseEventType.progress,
+                        delta=delta,
+                        logprobs=pending_logprobs[:] if request.logprobs else None,
+                    )
+                )
+                pending.clear()
+                pending_logprobs.clear()
+                last_flush = time.monotonic()
+                return chunk
+
+            # <|python_tag|> can only ever be the first generated token, so
+            # probe exactly once instead of re-scanning every delta.
+            first_token = True
             for token_result in self.generator.chat_completion(request):
                 tokens.append(token_result.token)
 
-                if not ipython and token_result.text.startswith("<|python_tag|>"):
+                if first_token and token_result.token == self._python_tag_id:
+                    first_token = False
                     ipython = True
                     yield ChatCompletionResponseStreamChunk(
                         event=ChatCompletionResponseEvent(
@@ -352,41 +453,33 @@ class MetaReferenceInferenceImpl(
                         )
                     )
                     continue
+                first_token = False
 
-                if token_result.text == "<|eot_id|>":
+                if token_result.token == self._eot_id:
                     stop_reason = StopReason.end_of_turn
-                    text = ""
-                elif token_result.text == "<|eom_id|>":
+                elif token_result.token == self._eom_id:
                     stop_reason = StopReason.end_of_message
-                    text = ""
-                else:
-                    text = token_result.text
-
-                if ipython:
-                    delta = ToolCallDelta(
-                        tool_call=text,
-                        parse_status=ToolCallParseStatus.in_progress,
-                    )
-                else:
-                    delta = TextDelta(text=text)
 
                 if stop_reason is None:
                     if request.logprobs:
                         assert len(token_result.logprobs) == 1
 
-                        logprobs.append(TokenLogProbs(logprobs_by_token={token_result.text: token_result.logprobs[0]}))
-                    yield ChatCompletionResponseStreamChunk(
-                        event=ChatCompletionResponseEvent(
-                            event_type=ChatCompletionResponseEventType.progress,
-                            delta=delta,
-                            stop_reason=stop_reason,
-                            logprobs=logprobs if request.logprobs else None,
+                        pending_logprobs.append(
+                            TokenLogProbs(logprobs_by_token={token_result.text: token_result.logprobs[0]})
                         )
-                    )
+                    pending.append(token_result.text)
+                    if (
+                        len(pending) >= STREAM_DELTA_BATCH_SIZE
+                        or time.monotonic() - last_flush >= STREAM_DELTA_FLUSH_INTERVAL_SECONDS
+                    ):
+                        yield flush_chunk()
 
             if stop_reason is None:
                 stop_reason = StopReason.out_of_tokens
 
+            if pending:
+                yield flush_chunk()
+
             message = self.generator.formatter.decode_assistant_message(tokens, stop_reason)
 
             parsed_tool_calls = len(message.tool_calls) > 0
@@ -424,8 +517,8 @@ class MetaReferenceInferenceImpl(
 
         if self.config.create_distributed_process_group:
             async with SEMAPHORE:
-                for x in impl():
+                async for x in stream_in_executor(impl()):
                     yield x
         else:
-            for x in impl():
+            async for x in stream_in_executor(impl()):
                 yield x
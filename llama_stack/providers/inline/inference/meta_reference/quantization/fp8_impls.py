@@ -10,6 +10,7 @@
 import collections
 
 import logging
+from functools import lru_cache
 from typing import Optional, Type
 
 log = logging.getLogger(__name__)
@@ -75,6 +76,19 @@ def ffn_swiglu(
     return (z @ w2.T).view(B, T, D)
 
 
+@lru_cache(maxsize=8)
+def _activation_scale_ub_tensor(fp8_activation_scale_ub: float) -> Tensor:
+    # The upper bound is a deployment-wide constant, but every quantize/load
+    # call was allocating (and H2D-copying) a fresh one-element CUDA tensor
+    # for it. Build one per distinct value and share it read-only across all
+    # weights.
+    return torch.tensor(
+        [fp8_activation_scale_ub],
+        dtype=torch.float,
+        device="cuda",
+    )
+
+
 @torch.inference_mode()
 def quantize_fp8(
     w: Tensor,
@@ -87,11 +101,7 @@ def quantize_fp8(
         w (Tensor): [n, k] input high precision tensor to quantize.
         fp8_activation_scale_ub (float): Upper bound for activation max.
     """
-    activation_scale_ub = torch.tensor(
-        [fp8_activation_scale_ub],
-        dtype=torch.float,
-        device="cuda",
-    )
+    activation_scale_ub = _activation_scale_ub_tensor(fp8_activation_scale_ub)
     wq, w_scale = torch.ops.fbgemm.quantize_fp8_per_row(w)
     del w
     return Fp8RowwiseWeights(
@@ -114,11 +124,7 @@ def load_fp8(
         w (Tensor): [n, k] input FP8.
         fp8_activation_scale_ub (float): Upper bound for activation max.
     """
-    activation_scale_ub = torch.tensor(
-        [fp8_activation_scale_ub],
-        dtype=torch.float,
-        device="cuda",
-    )
+    activation_scale_ub = _activation_scale_ub_tensor(fp8_activation_scale_ub)
     return Fp8RowwiseWeights(
         weight=w.to(torch.float8_e4m3fn).to(device="cuda"),
         scale=w_scale.to(device="cuda"),
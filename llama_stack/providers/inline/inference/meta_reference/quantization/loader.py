@@ -13,6 +13,7 @@ from typing import Any, Dict, List, Optional
 
 import torch
 
+from fairscale.nn.model_parallel.initialize import get_model_parallel_rank
 from fairscale.nn.model_parallel.layers import ColumnParallelLinear, RowParallelLinear
 from fairscale.nn.model_parallel.mappings import reduce_from_model_parallel_region
 
@@ -32,6 +33,13 @@ from ..config import MetaReferenceQuantizedInferenceConfig
 
 log = logging.getLogger(__name__)
 
+# Weights in different transformer blocks are independent, so their H2D
+# copies and quantization kernels are issued round-robin across a small pool
+# of CUDA streams, synchronizing every few blocks to bound how many BF16
+# uploads are in flight at once.
+QUANTIZATION_STREAM_POOL_SIZE = 3
+QUANTIZATION_SYNC_EVERY_N_BLOCKS = 4
+
 
 def swiglu_wrapper(
     self,
@@ -60,44 +68,78 @@ def convert_to_fp8_quantized_model(
     llama_model = resolve_model(config.model)
     assert llama_model is not None, f"Model {config.model} not found"
 
+    if config.fp8_skip_layers is not None:
+        skip_layers = set(config.fp8_skip_layers)
+    else:
+        skip_layers = {0, model.n_layers - 1}
+
+    blocks_to_quantize = [
+        block for block in model.layers if isinstance(block, TransformerBlock) and block.layer_id not in skip_layers
+    ]
+
     # Move weights to GPU with quantization
     if llama_model.quantization_format == CheckpointQuantizationFormat.fp8_mixed.value:
         log.info("Loading fp8 scales...")
-        fp8_scales_path = os.path.join(checkpoint_dir, f"fp8_scales_{get_model_parallel_rank()}.pt")
-        assert os.path.isfile(fp8_scales_path), f"fp8_scales_path not found for rank {get_model_parallel_rank()}"
-        fp8_scales = torch.load(fp8_scales_path, weights_only=True)
-
-        for block in model.layers:
-            if isinstance(block, TransformerBlock):
-                if block.layer_id == 0 or block.layer_id == (model.n_layers - 1):
-                    continue
-
-                block.feed_forward.forward = swiglu_wrapper.__get__(block.feed_forward)
-                for key in ("w1", "w3", "w2"):
-                    param = getattr(block.feed_forward, key)
-                    param.weight = load_fp8(
-                        param.weight,
-                        fp8_scales[f"{block.layer_id}_feed_forward.{key}_{get_model_parallel_rank()}"],
-                        fp8_activation_scale_ub,
-                    )
+        rank = get_model_parallel_rank()
+        fp8_scales_path = os.path.join(checkpoint_dir, f"fp8_scales_{rank}.pt")
+        assert os.path.isfile(fp8_scales_path), f"fp8_scales_path not found for rank {rank}"
+        # mmap the scales file so tensors are demand-paged from the page cache
+        # instead of materializing another full copy in the process heap.
+        fp8_scales = torch.load(fp8_scales_path, weights_only=True, mmap=True, map_location="cpu")
+
+        for block in blocks_to_quantize:
+            block.feed_forward.forward = swiglu_wrapper.__get__(block.feed_forward)
+            for key in ("w1", "w3", "w2"):
+                param = getattr(block.feed_forward, key)
+                param.weight = load_fp8(
+                    param.weight,
+                    fp8_scales[f"{block.layer_id}_feed_forward.{key}_{rank}"],
+                    fp8_activation_scale_ub,
+                )
     else:
         log.info("Quantizing fp8 weights from bf16...")
-        for block in model.layers:
-            if isinstance(block, TransformerBlock):
-                if block.layer_id == 0 or block.layer_id == (model.n_layers - 1):
-                    continue
-                block.feed_forward.forward = swiglu_wrapper.__get__(block.feed_forward)
+        streams = [torch.cuda.Stream() for _ in range(QUANTIZATION_STREAM_POOL_SIZE)]
+        # BF16 sources whose quantize kernels may still be in flight on a
+        # side stream; their storage can only be dropped after a synchronize,
+        # otherwise the allocator may recycle it mid-read.
+        pending_release: List[Tensor] = []
+
+        def release_pending():
+            for bf16_weight in pending_release:
+                bf16_weight.data = torch.empty(0)
+            pending_release.clear()
+
+        for i, block in enumerate(blocks_to_quantize):
+            block.feed_forward.forward = swiglu_wrapper.__get__(block.feed_forward)
+            with torch.cuda.stream(streams[i % QUANTIZATION_STREAM_POOL_SIZE]):
                 for key in ("w1", "w3", "w2"):
                     param = getattr(block.feed_forward, key)
+                    bf16_weight = param.weight
                     param.weight = quantize_fp8(
-                        param.weight,
+                        bf16_weight,
                         fp8_activation_scale_ub,
                         output_device=torch.device("cuda"),
                     )
-
-    for _, parameter in model.named_parameters():
-        if not isinstance(parameter, Fp8ScaledWeights):
-            parameter.data = parameter.to(device="cuda")
+                    pending_release.append(bf16_weight)
+            if (i + 1) % QUANTIZATION_SYNC_EVERY_N_BLOCKS == 0:
+                torch.cuda.synchronize()
+                release_pending()
+                torch.cuda.empty_cache()
+        torch.cuda.synchronize()
+        release_pending()
+
+    # Move the remaining (non-FP8) parameters in one coalesced batch rather
+    # than issuing a separate H2D copy + Python tensor construction per
+    # parameter; _foreach_copy_ queues all the copies back to back.
+    cpu_params = [
+        p for _, p in model.named_parameters() if not isinstance(p, Fp8ScaledWeights) and p.device.type != "cuda"
+    ]
+    if cpu_params:
+        gpu_tensors = [torch.empty_like(p.data, device="cuda") for p in cpu_params]
+        torch._foreach_copy_(gpu_tensors, [p.data for p in cpu_params], non_blocking=True)
+        torch.cuda.synchronize()
+        for parameter, gpu_tensor in zip(cpu_params, gpu_tensors):
+            parameter.data = gpu_tensor
     return model
 
 
@@ -25,6 +25,28 @@ COLORS = {
     "white": "\033[37m",
 }
 
+SEVERITY_COLORS = {
+    "error": f"{COLORS['bold']}{COLORS['red']}",
+    "warn": f"{COLORS['bold']}{COLORS['yellow']}",
+    "info": COLORS["white"],
+    "debug": COLORS["dim"],
+}
+
+# strftime is slow (locale machinery); within one second only the millisecond
+# part changes, so cache the formatted HH:MM:SS and append millis by hand.
+_last_sec = -1
+_last_sec_str = ""
+
+
+def _format_timestamp(nanos: int) -> str:
+    global _last_sec, _last_sec_str
+    sec, nanos_rem = divmod(nanos, 1_000_000_000)
+    if sec != _last_sec:
+        _last_sec = sec
+        _last_sec_str = datetime.utcfromtimestamp(sec).strftime("%H:%M:%S")
+    return f"{_last_sec_str}.{nanos_rem // 1_000_000:03d}"
+
+
 
 class ConsoleSpanProcessor(SpanProcessor):
     def __init__(self, print_attributes: bool = False):
@@ -34,7 +56,7 @@ class ConsoleSpanProcessor(SpanProcessor):
         if span.attributes and span.attributes.get("__autotraced__"):
             return
 
-        timestamp = datetime.utcfromtimestamp(span.start_time / 1e9).strftime("%H:%M:%S.%f")[:-3]
+        timestamp = _format_timestamp(span.start_time)
 
         print(
             f"{COLORS['dim']}{timestamp}{COLORS['reset']} "
@@ -46,7 +68,7 @@ class ConsoleSpanProcessor(SpanProcessor):
         if span.attributes and span.attributes.get("__autotraced__"):
             return
 
-        timestamp = datetime.utcfromtimestamp(span.end_time / 1e9).strftime("%H:%M:%S.%f")[:-3]
+        timestamp = _format_timestamp(span.end_time)
 
         span_context = (
             f"{COLORS['dim']}{timestamp}{COLORS['reset']} "
@@ -62,7 +84,9 @@ class ConsoleSpanProcessor(SpanProcessor):
         duration_ms = (span.end_time - span.start_time) / 1e6
         span_context += f"{COLORS['reset']} ({duration_ms:.2f}ms)"
 
-        print(span_context)
+        # Collect everything for this span and write it with one print call:
+        # one stdout lock/flush per span instead of one per attribute/event.
+        lines = [span_context]
 
         if self.print_attributes and span.attributes:
             for key, value in span.attributes.items():
@@ -71,31 +95,27 @@ class ConsoleSpanProcessor(SpanProcessor):
                 str_value = str(value)
                 if len(str_value) > 1000:
                     str_value = str_value[:997] + "..."
-                print(f"    {COLORS['dim']}{key}: {str_value}{COLORS['reset']}")
+                lines.append(f"    {COLORS['dim']}{key}: {str_value}{COLORS['reset']}")
 
         for event in span.events:
-            event_time = datetime.utcfromtimestamp(event.timestamp / 1e9).strftime("%H:%M:%S.%f")[:-3]
+            event_time = _format_timestamp(event.timestamp)
 
             severity = event.attributes.get("severity", "info")
             message = event.attributes.get("message", event.name)
             if isinstance(message, (dict, list)):
                 message = json.dumps(message, indent=2)
 
-            severity_colors = {
-                "error": f"{COLORS['bold']}{COLORS['red']}",
-                "warn": f"{COLORS['bold']}{COLORS['yellow']}",
-                "info": COLORS["white"],
-                "debug": COLORS["dim"],
-            }
-            msg_color = severity_colors.get(severity, COLORS["white"])
+            msg_color = SEVERITY_COLORS.get(severity, COLORS["white"])
 
-            print(f" {event_time} {msg_color}[{severity.upper()}] {message}{COLORS['reset']}")
+            lines.append(f" {event_time} {msg_color}[{severity.upper()}] {message}{COLORS['reset']}")
 
             if event.attributes:
                 for key, value in event.attributes.items():
                     if key.startswith("__") or key in ["message", "severity"]:
                         continue
-                    print(f"   {COLORS['dim']}{key}: {value}{COLORS['reset']}")
+                    lines.append(f"   {COLORS['dim']}{key}: {value}{COLORS['reset']}")
+
+        print("\n".join(lines))
 
     def shutdown(self) -> None:
         """Shutdown the processor."""
@@ -192,8 +192,6 @@ class TelemetryAdapter(TelemetryDatasetMixin, Telemetry):
             span_id = string_to_span_id(event.span_id)
             trace_id = string_to_trace_id(event.trace_id)
             tracer = trace.get_tracer(__name__)
-            if event.attributes is None:
-                event.attributes = {}
             event.attributes["__ttl__"] = ttl_seconds
 
             if isinstance(event.payload, SpanStartPayload):
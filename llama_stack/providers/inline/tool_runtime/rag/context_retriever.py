@@ -4,6 +4,7 @@
 # This source code is licensed under the terms described in the LICENSE file in
 # the root directory of this source tree.
 
+from functools import lru_cache
 
 from jinja2 import Template
 
@@ -21,6 +22,14 @@ from llama_stack.providers.utils.inference.prompt_adapter import (
 )
 
 
+@lru_cache(maxsize=128)
+def _compiled_template(source: str) -> Template:
+    # Jinja lexes/parses/compiles the template on construction; for the short
+    # templates used here that dominates render cost, so compile each distinct
+    # template string once.
+    return Template(source)
+
+
 async def generate_rag_query(
     config: RAGQueryGeneratorConfig,
     content: InterleavedContent,
@@ -44,6 +53,9 @@ async def default_rag_query_generator(
     content: InterleavedContent,
     **kwargs,
 ):
+    if isinstance(content, str):
+        # The common single-turn text query; no interleaving to flatten.
+        return content
     return interleaved_content_as_str(content, sep=config.separator)
 
 
@@ -61,7 +73,7 @@ async def llm_rag_query_generator(
     else:
         messages = [interleaved_content_as_str(content)]
 
-    template = Template(config.template)
+    template = _compiled_template(config.template)
     content = template.render({"messages": messages})
 
     model = config.model
@@ -8,7 +8,7 @@ import warnings
 from typing import AsyncIterator, List, Optional, Union
 
 import groq
-from groq import Groq
+from groq import AsyncGroq
 from llama_models.datatypes import SamplingParams
 from llama_models.llama3.api.datatypes import ToolDefinition, ToolPromptFormat
 from llama_models.sku_list import CoreModelId
@@ -26,6 +26,7 @@ from llama_stack.apis.inference import (
     Message,
     ResponseFormat,
     ToolChoice,
+    ToolConfig,
 )
 from llama_stack.distribution.request_headers import NeedsRequestProviderData
 from llama_stack.providers.remote.inference.groq.config import GroqConfig
@@ -123,7 +124,7 @@ class GroqInferenceAdapter(Inference, ModelRegistryHelper, NeedsRequestProviderD
         )
 
         try:
-            response = self._get_client().chat.completions.create(**request)
+            response = await self._get_client().chat.completions.create(**request)
         except groq.BadRequestError as e:
             if e.body.get("error", {}).get("code") == "tool_use_failed":
                 # For smaller models, Groq may fail to call a tool even when the request is well formed
@@ -143,13 +144,13 @@ class GroqInferenceAdapter(Inference, ModelRegistryHelper, NeedsRequestProviderD
     ) -> EmbeddingsResponse:
         raise NotImplementedError()
 
-    def _get_client(self) -> Groq:
+    def _get_client(self) -> AsyncGroq:
         if self._config.api_key is not None:
-            return Groq(api_key=self._config.api_key)
+            return AsyncGroq(api_key=self._config.api_key)
         else:
             provider_data = self.get_request_provider_data()
             if provider_data is None or not provider_data.groq_api_key:
                 raise ValueError(
                     'Pass Groq API Key in the header X-LlamaStack-Provider-Data as { "groq_api_key": "<your api key>" }'
                 )
-            return Groq(api_key=provider_data.groq_api_key)
+            return AsyncGroq(api_key=provider_data.groq_api_key)
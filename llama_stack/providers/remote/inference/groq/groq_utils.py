@@ -8,7 +8,7 @@ import json
 import warnings
 from typing import AsyncGenerator, Literal, Union
 
-from groq import Stream
+from groq import AsyncStream
 from groq.types.chat.chat_completion import ChatCompletion
 from groq.types.chat.chat_completion_assistant_message_param import (
     ChatCompletionAssistantMessageParam,
@@ -97,15 +97,19 @@ def convert_chat_completion_request(
     )
 
 
+_MESSAGE_PARAM_BY_ROLE = {
+    "system": ChatCompletionSystemMessageParam,
+    "user": ChatCompletionUserMessageParam,
+    "assistant": ChatCompletionAssistantMessageParam,
+}
+
+
 def _convert_message(message: Message) -> ChatCompletionMessageParam:
-    if message.role == "system":
-        return ChatCompletionSystemMessageParam(role="system", content=message.content)
-    elif message.role == "user":
-        return ChatCompletionUserMessageParam(role="user", content=message.content)
-    elif message.role == "assistant":
-        return ChatCompletionAssistantMessageParam(role="assistant", content=message.content)
-    else:
-        raise ValueError(f"Invalid message role: {message.role}")
+    try:
+        param_cls = _MESSAGE_PARAM_BY_ROLE[message.role]
+    except KeyError:
+        raise ValueError(f"Invalid message role: {message.role}") from None
+    return param_cls(role=message.role, content=message.content)
 
 
 def _convert_groq_tool_definition(tool_definition: ToolDefinition) -> dict:
@@ -173,6 +177,13 @@ def convert_chat_completion_response(
         )
 
 
+_FINISH_REASON_TO_STOP_REASON = {
+    "stop": StopReason.end_of_turn,
+    "length": StopReason.out_of_tokens,
+    "tool_calls": StopReason.end_of_message,
+}
+
+
 def _map_finish_reason_to_stop_reason(
     finish_reason: Literal["stop", "length", "tool_calls"],
 ) -> StopReason:
@@ -184,21 +195,17 @@ def _map_finish_reason_to_stop_reason(
         - length -> maximum number of tokens specified in the request was reached
         - tool_calls -> model called a tool
     """
-    if finish_reason == "stop":
-        return StopReason.end_of_turn
-    elif finish_reason == "length":
-        return StopReason.out_of_tokens
-    elif finish_reason == "tool_calls":
-        return StopReason.end_of_message
-    else:
-        raise ValueError(f"Invalid finish reason: {finish_reason}")
+    try:
+        return _FINISH_REASON_TO_STOP_REASON[finish_reason]
+    except KeyError:
+        raise ValueError(f"Invalid finish reason: {finish_reason}") from None
 
 
 async def convert_chat_completion_response_stream(
-    stream: Stream[ChatCompletionChunk],
+    stream: AsyncStream[ChatCompletionChunk],
 ) -> AsyncGenerator[ChatCompletionResponseStreamChunk, None]:
     event_type = ChatCompletionResponseEventType.start
-    for chunk in stream:
+    async for chunk in stream:
         choice = chunk.choices[0]
 
         if choice.finish_reason:
@@ -6,6 +6,7 @@
 
 
 import logging
+from functools import lru_cache
 from typing import AsyncGenerator, List, Optional
 
 from huggingface_hub import AsyncInferenceClient, HfApi
@@ -54,6 +55,23 @@ from .config import InferenceAPIImplConfig, InferenceEndpointImplConfig, TGIImpl
 
 log = logging.getLogger(__name__)
 
+# Shared across every request; TGI only reads the list, so one instance is safe.
+_STOP_SEQUENCES = ["<|eom_id|>", "<|eot_id|>"]
+
+
+@lru_cache(maxsize=1)
+def _shared_formatter() -> ChatFormat:
+    # ChatFormat is read-only after construction and wraps the singleton
+    # tokenizer, so all adapter instances can share one.
+    return ChatFormat(Tokenizer.get_instance())
+
+
+# Scan the SKU registry once at import time; every adapter instantiation used
+# to walk all_registered_models() twice.
+_MODELS_WITH_HF_REPO = [model for model in all_registered_models() if model.huggingface_repo]
+
+_HF_REPO_TO_LLAMA_MODEL_ID = {model.huggingface_repo: model.descriptor() for model in _MODELS_WITH_HF_REPO}
+
 
 def build_model_aliases():
     return [
@@ -61,8 +79,7 @@ def build_model_aliases():
             model.huggingface_repo,
             model.descriptor(),
         )
-        for model in all_registered_models()
-        if model.huggingface_repo
+        for model in _MODELS_WITH_HF_REPO
     ]
 
 
@@ -72,11 +89,9 @@ class _HfAdapter(Inference, ModelsProtocolPrivate):
     model_id: str
 
     def __init__(self) -> None:
-        self.formatter = ChatFormat(Tokenizer.get_instance())
+        self.formatter = _shared_formatter()
         self.register_helper = ModelRegistryHelper(build_model_aliases())
-        self.huggingface_repo_to_llama_model_id = {
-            model.huggingface_repo: model.descriptor() for model in all_registered_models() if model.huggingface_repo
-        }
+        self.huggingface_repo_to_llama_model_id = _HF_REPO_TO_LLAMA_MODEL_ID
 
     async def shutdown(self) -> None:
         pass
@@ -156,7 +171,7 @@ class _HfAdapter(Inference, ModelsProtocolPrivate):
             stream=request.stream,
             details=True,
             max_new_tokens=self._get_max_new_tokens(request.sampling_params, input_tokens),
-            stop_sequences=["<|eom_id|>", "<|eot_id|>"],
+            stop_sequences=_STOP_SEQUENCES,
             **self._build_options(request.sampling_params, request.response_format),
         )
 
@@ -186,7 +201,7 @@ class _HfAdapter(Inference, ModelsProtocolPrivate):
 
         choice = OpenAICompatCompletionChoice(
             finish_reason=r.details.finish_reason,
-            text="".join(t.text for t in r.details.tokens),
+            text=r.generated_text,
         )
 
         response = OpenAICompatCompletionResponse(
@@ -231,7 +246,7 @@ class _HfAdapter(Inference, ModelsProtocolPrivate):
 
         choice = OpenAICompatCompletionChoice(
             finish_reason=r.details.finish_reason,
-            text="".join(t.text for t in r.details.tokens),
+            text=r.generated_text,
         )
         response = OpenAICompatCompletionResponse(
             choices=[choice],
@@ -264,7 +279,7 @@ class _HfAdapter(Inference, ModelsProtocolPrivate):
             stream=request.stream,
             details=True,
             max_new_tokens=self._get_max_new_tokens(request.sampling_params, input_tokens),
-            stop_sequences=["<|eom_id|>", "<|eot_id|>"],
+            stop_sequences=_STOP_SEQUENCES,
             **self._build_options(request.sampling_params, request.response_format),
         )
 
@@ -4,6 +4,7 @@
 # This source code is licensed under the terms described in the LICENSE file in
 # the root directory of this source tree.
 
+import asyncio
 import logging
 from typing import AsyncGenerator, List, Optional, Union
 
@@ -195,7 +196,11 @@ class VLLMInferenceAdapter(Inference, ModelsProtocolPrivate):
         input_dict = {}
 
         if isinstance(request, ChatCompletionRequest):
-            input_dict["messages"] = [await convert_message_to_openai_dict(m, download=True) for m in request.messages]
+            # download=True may fetch remote image content per message; run the
+            # conversions concurrently instead of paying each round trip in turn.
+            input_dict["messages"] = list(
+                await asyncio.gather(*(convert_message_to_openai_dict(m, download=True) for m in request.messages))
+            )
         else:
             assert not request_has_media(request), "vLLM does not support media for Completion requests"
             input_dict["prompt"] = await completion_request_to_prompt(
@@ -412,7 +412,7 @@ class TestConvertNonStreamChatCompletionResponse:
 class TestConvertStreamChatCompletionResponse:
     @pytest.mark.asyncio
     async def test_returns_stream(self):
-        def chat_completion_stream():
+        async def chat_completion_stream():
             messages = ["Hello ", "World ", " !"]
             for i, message in enumerate(messages):
                 chunk = self._dummy_chat_completion_chunk()
@@ -450,7 +450,7 @@ class TestConvertStreamChatCompletionResponse:
 
     @pytest.mark.asyncio
     async def test_returns_tool_calls_stream(self):
-        def tool_call_stream():
+        async def tool_call_stream():
             tool_calls = [
                 ToolCall(
                     call_id="tool_call_id",
@@ -497,7 +497,7 @@ class TestConvertStreamChatCompletionResponse:
 
     @pytest.mark.asyncio
     async def test_returns_tool_calls_stream_with_unparseable_tool_calls(self):
-        def tool_call_stream():
+        async def tool_call_stream():
             chunk = self._dummy_chat_completion_chunk_with_tool_call()
             chunk.choices[0].delta.tool_calls = [
                 ChoiceDeltaToolCall(
@@ -524,7 +524,7 @@ class TestConvertStreamChatCompletionResponse:
         chunk = await iter.__anext__()
         assert chunk.event.event_type == ChatCompletionResponseEventType.start
         assert (
-            chunk.event.delta.content
+            chunk.event.delta.tool_call
             == '{"call_id":"tool_call_id","tool_name":"get_flight_info","arguments":"(origin=AU, destination=LAX)"}'
         )
         assert chunk.event.delta.parse_status == ToolCallParseStatus.failed
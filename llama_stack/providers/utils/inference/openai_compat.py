@@ -4,6 +4,7 @@
 # This source code is licensed under the terms described in the LICENSE file in
 # the root directory of this source tree.
 
+import asyncio
 from typing import AsyncGenerator, Dict, List, Optional, Union
 
 from llama_models.datatypes import (
@@ -105,15 +106,16 @@ def text_from_choice(choice) -> str:
     return choice.text
 
 
-def get_stop_reason(finish_reason: str) -> StopReason:
-    if finish_reason in ["stop", "eos"]:
-        return StopReason.end_of_turn
-    elif finish_reason == "eom":
-        return StopReason.end_of_message
-    elif finish_reason == "length":
-        return StopReason.out_of_tokens
+_FINISH_REASON_TO_STOP_REASON = {
+    "stop": StopReason.end_of_turn,
+    "eos": StopReason.end_of_turn,
+    "eom": StopReason.end_of_message,
+    "length": StopReason.out_of_tokens,
+}
+
 
-    return StopReason.out_of_tokens
+def get_stop_reason(finish_reason: str) -> StopReason:
+    return _FINISH_REASON_TO_STOP_REASON.get(finish_reason, StopReason.out_of_tokens)
 
 
 def convert_openai_completion_logprobs(
@@ -148,23 +150,24 @@ def convert_openai_completion_logprobs_stream(text: str, logprobs: Optional[Unio
 
 def process_completion_response(response: OpenAICompatCompletionResponse, formatter: ChatFormat) -> CompletionResponse:
     choice = response.choices[0]
+    text = choice.text
+    # removesuffix returns the original object when the suffix is absent, so
+    # the identity check doubles as the endswith test: one pass over the text
+    # and at most one slice allocation.
     # drop suffix <eot_id> if present and return stop reason as end of turn
-    if choice.text.endswith("<|eot_id|>"):
-        return CompletionResponse(
-            stop_reason=StopReason.end_of_turn,
-            content=choice.text[: -len("<|eot_id|>")],
-            logprobs=convert_openai_completion_logprobs(choice.logprobs),
-        )
-    # drop suffix <eom_id> if present and return stop reason as end of message
-    if choice.text.endswith("<|eom_id|>"):
-        return CompletionResponse(
-            stop_reason=StopReason.end_of_message,
-            content=choice.text[: -len("<|eom_id|>")],
-            logprobs=convert_openai_completion_logprobs(choice.logprobs),
-        )
+    content = text.removesuffix("<|eot_id|>")
+    if content is not text:
+        stop_reason = StopReason.end_of_turn
+    else:
+        # drop suffix <eom_id> if present and return stop reason as end of message
+        content = text.removesuffix("<|eom_id|>")
+        if content is not text:
+            stop_reason = StopReason.end_of_message
+        else:
+            stop_reason = get_stop_reason(choice.finish_reason)
     return CompletionResponse(
-        stop_reason=get_stop_reason(choice.finish_reason),
-        content=choice.text,
+        stop_reason=stop_reason,
+        content=content,
         logprobs=convert_openai_completion_logprobs(choice.logprobs),
     )
 
@@ -233,7 +236,9 @@ async def process_chat_completion_stream_response(
         )
     )
 
-    buffer = ""
+    # Accumulate fragments in a list and join once at the end; repeated
+    # str += is quadratic in the total response size.
+    buffer = []
     ipython = False
     stop_reason = None
 
@@ -265,7 +270,7 @@ async def process_chat_completion_stream_response(
                     ),
                 )
             )
-            buffer += text
+            buffer.append(text)
             continue
 
         if text == "<|eot_id|>":
@@ -278,7 +283,7 @@ async def process_chat_completion_stream_response(
             continue
 
         if ipython:
-            buffer += text
+            buffer.append(text)
             delta = ToolCallDelta(
                 tool_call=text,
                 parse_status=ToolCallParseStatus.in_progress,
@@ -292,7 +297,7 @@ async def process_chat_completion_stream_response(
                 )
             )
         else:
-            buffer += text
+            buffer.append(text)
             yield ChatCompletionResponseStreamChunk(
                 event=ChatCompletionResponseEvent(
                     event_type=ChatCompletionResponseEventType.progress,
@@ -302,7 +307,7 @@ async def process_chat_completion_stream_response(
             )
 
     # parse tool calls and report errors
-    message = formatter.decode_assistant_message_from_content(buffer, stop_reason)
+    message = formatter.decode_assistant_message_from_content("".join(buffer), stop_reason)
     parsed_tool_calls = len(message.tool_calls) > 0
     if ipython and not parsed_tool_calls:
         yield ChatCompletionResponseStreamChunk(
@@ -352,7 +357,8 @@ async def convert_message_to_openai_dict(message: Message, download: bool = Fals
             return {"type": "text", "text": text}
 
     if isinstance(message.content, list):
-        content = [await _convert_content(c) for c in message.content]
+        # Fetch multi-part content (e.g. several image URLs) concurrently.
+        content = list(await asyncio.gather(*(_convert_content(c) for c in message.content)))
     else:
         content = [await _convert_content(message.content)]
 
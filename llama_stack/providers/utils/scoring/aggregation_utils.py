@@ -4,6 +4,7 @@
 # This source code is licensed under the terms described in the LICENSE file in
 # the root directory of this source tree.
 import statistics
+from collections import Counter
 from typing import Any, Dict, List
 
 from llama_stack.apis.scoring import ScoringResultRow
@@ -22,18 +23,23 @@ def aggregate_accuracy(scoring_results: List[ScoringResultRow]) -> Dict[str, Any
 
 
 def aggregate_average(scoring_results: List[ScoringResultRow]) -> Dict[str, Any]:
-    return {
-        "average": sum(result["score"] for result in scoring_results if result["score"] is not None)
-        / len([_ for _ in scoring_results if _["score"] is not None]),
-    }
+    # Single pass over the results instead of one pass to sum and a second
+    # (list-allocating) pass to count the non-None scores.
+    total = 0.0
+    count = 0
+    for result in scoring_results:
+        score = result["score"]
+        if score is not None:
+            total += score
+            count += 1
+    return {"average": total / count}
 
 
 def aggregate_categorical_count(
     scoring_results: List[ScoringResultRow],
 ) -> Dict[str, Any]:
-    scores = [str(r["score"]) for r in scoring_results]
-    unique_scores = sorted(list(set(scores)))
-    return {"categorical_count": {s: scores.count(s) for s in unique_scores}}
+    counts = Counter(str(r["score"]) for r in scoring_results)
+    return {"categorical_count": {s: counts[s] for s in sorted(counts)}}
 
 
 def aggregate_median(scoring_results: List[ScoringResultRow]) -> Dict[str, Any]:
@@ -4,6 +4,7 @@
 # This source code is licensed under the terms described in the LICENSE file in
 # the root directory of this source tree.
 
+import asyncio
 from typing import List, Optional
 
 from llama_stack.apis.datasetio import DatasetIO
@@ -15,6 +16,13 @@ class TelemetryDatasetMixin:
 
     datasetio_api: DatasetIO
 
+    # Rows are appended to the dataset in chunks of this size so that exporting a
+    # large telemetry store does not materialize every row in a single request.
+    SPAN_EXPORT_BATCH_SIZE = 1000
+
+    # Maximum number of span-tree fetches in flight while answering query_spans.
+    SPAN_TREE_FETCH_CONCURRENCY = 16
+
     async def save_spans_to_dataset(
         self,
         attribute_filters: List[QueryCondition],
@@ -31,20 +39,25 @@ class TelemetryDatasetMixin:
             max_depth=max_depth,
         )
 
-        rows = [
-            {
-                "trace_id": span.trace_id,
-                "span_id": span.span_id,
-                "parent_span_id": span.parent_span_id,
-                "name": span.name,
-                "start_time": span.start_time,
-                "end_time": span.end_time,
-                **{attr: span.attributes.get(attr) for attr in attributes_to_save},
-            }
-            for span in spans
-        ]
-
-        await self.datasetio_api.append_rows(dataset_id=dataset_id, rows=rows)
+        rows = []
+        for span in spans:
+            rows.append(
+                {
+                    "trace_id": span.trace_id,
+                    "span_id": span.span_id,
+                    "parent_span_id": span.parent_span_id,
+                    "name": span.name,
+                    "start_time": span.start_time,
+                    "end_time": span.end_time,
+                    **{attr: span.attributes.get(attr) for attr in attributes_to_save},
+                }
+            )
+            if len(rows) >= self.SPAN_EXPORT_BATCH_SIZE:
+                await self.datasetio_api.append_rows(dataset_id=dataset_id, rows=rows)
+                rows = []
+
+        if rows:
+            await self.datasetio_api.append_rows(dataset_id=dataset_id, rows=rows)
 
     async def query_spans(
         self,
@@ -54,17 +67,28 @@ class TelemetryDatasetMixin:
     ) -> QuerySpansResponse:
         traces = await self.query_traces(attribute_filters=attribute_filters)
         spans = []
+        wanted_attributes = set(attributes_to_return)
 
-        for trace in traces.data:
-            spans_by_id_resp = await self.get_span_tree(
-                span_id=trace.root_span_id,
-                attributes_to_return=attributes_to_return,
-                max_depth=max_depth,
-            )
+        # Fetch span trees concurrently, bounded so we don't storm the backing
+        # store when a filter matches many traces.
+        semaphore = asyncio.Semaphore(self.SPAN_TREE_FETCH_CONCURRENCY)
+
+        async def fetch_span_tree(trace):
+            async with semaphore:
+                return await self.get_span_tree(
+                    span_id=trace.root_span_id,
+                    attributes_to_return=attributes_to_return,
+                    max_depth=max_depth,
+                )
+
+        span_tree_responses = await asyncio.gather(*(fetch_span_tree(trace) for trace in traces.data))
 
+        for trace, spans_by_id_resp in zip(traces.data, span_tree_responses):
             for span in spans_by_id_resp.data.values():
-                if span.attributes and all(
-                    attr in span.attributes and span.attributes[attr] is not None for attr in attributes_to_return
+                if (
+                    span.attributes
+                    and wanted_attributes.issubset(span.attributes)
+                    and all(span.attributes[attr] is not None for attr in attributes_to_return)
                 ):
                     spans.append(
                         Span(
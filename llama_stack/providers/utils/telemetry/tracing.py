@@ -41,6 +41,10 @@ BACKGROUND_LOGGER = None
 
 
 class BackgroundLogger:
+    # How many queued events the worker drains per wakeup; keeps the producer
+    # side fire-and-forget while amortizing event-loop overhead on bursts.
+    MAX_BATCH_SIZE = 256
+
     def __init__(self, api: Telemetry, capacity: int = 1000):
         self.api = api
         self.log_queue = queue.Queue(maxsize=capacity)
@@ -54,18 +58,31 @@ class BackgroundLogger:
             log.error("Log queue is full, dropping event")
 
     def _process_logs(self):
+        # One long-lived loop for the worker thread; asyncio.run() per event
+        # would build and tear down a fresh event loop for every log line.
+        loop = asyncio.new_event_loop()
         while True:
+            batch = [self.log_queue.get()]
+            while len(batch) < self.MAX_BATCH_SIZE:
+                try:
+                    batch.append(self.log_queue.get_nowait())
+                except queue.Empty:
+                    break
+
             try:
-                event = self.log_queue.get()
-                # figure out how to use a thread's native loop
-                asyncio.run(self.api.log_event(event))
+                loop.run_until_complete(self._log_batch(batch))
             except Exception:
                 import traceback
 
                 traceback.print_exc()
                 print("Error processing log event")
             finally:
-                self.log_queue.task_done()
+                for _ in batch:
+                    self.log_queue.task_done()
+
+    async def _log_batch(self, batch):
+        for event in batch:
+            await self.api.log_event(event)
 
     def __del__(self):
         self.log_queue.join()
@@ -86,7 +103,8 @@ class TraceContext:
             name=name,
             start_time=datetime.now(),
             parent_span_id=current_span.span_id if current_span else None,
-            attributes=attributes,
+            # the field is a plain dict; an explicit None would fail validation
+            attributes=attributes or {},
         )
 
         self.logger.log_event(
@@ -213,7 +231,7 @@ class TelemetryHandler(logging.Handler):
 class SpanContextManager:
     def __init__(self, name: str, attributes: Dict[str, Any] = None):
         self.name = name
-        self.attributes = attributes
+        self.attributes = attributes or {}
         self.span = None
 
     def __enter__(self):
@@ -231,8 +249,6 @@ class SpanContextManager:
 
     def set_attribute(self, key: str, value: Any):
         if self.span:
-            if self.span.attributes is None:
-                self.span.attributes = {}
             self.span.attributes[key] = serialize_value(value)
 
     async def __aenter__(self):
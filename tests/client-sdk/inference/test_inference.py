@@ -25,6 +25,25 @@ PROVIDER_LOGPROBS_TOP_K = set(
 )
 
 
+class CompletionAnswerFormat(BaseModel):
+    name: str
+    year_born: str
+    year_retired: str
+
+
+class ChatAnswerFormat(BaseModel):
+    first_name: str
+    last_name: str
+    year_of_birth: int
+    num_seasons_in_nba: int
+
+
+# model_json_schema() walks the whole model schema on every call; build the
+# response formats once instead of per test invocation.
+COMPLETION_ANSWER_JSON_SCHEMA = CompletionAnswerFormat.model_json_schema()
+CHAT_ANSWER_JSON_SCHEMA = ChatAnswerFormat.model_json_schema()
+
+
 @pytest.fixture(scope="session")
 def provider_tool_format(inference_provider_type):
     return (
@@ -150,11 +169,6 @@ def test_text_completion_structured_output(llama_stack_client, text_model_id, in
     Michael Jordan was born in 1963. He played basketball for the Chicago Bulls. He retired in 2003.
     """
 
-    class AnswerFormat(BaseModel):
-        name: str
-        year_born: str
-        year_retired: str
-
     response = llama_stack_client.inference.completion(
         model_id=text_model_id,
         content=user_input,
@@ -164,10 +178,10 @@ def test_text_completion_structured_output(llama_stack_client, text_model_id, in
         },
         response_format={
             "type": "json_schema",
-            "json_schema": AnswerFormat.model_json_schema(),
+            "json_schema": COMPLETION_ANSWER_JSON_SCHEMA,
         },
     )
-    answer = AnswerFormat.model_validate_json(response.content)
+    answer = CompletionAnswerFormat.model_validate_json(response.content)
     assert answer.name == "Michael Jordan"
     assert answer.year_born == "1963"
     assert answer.year_retired == "2003"
@@ -270,12 +284,6 @@ def test_text_chat_completion_with_tool_calling_and_streaming(
 
 
 def test_text_chat_completion_structured_output(llama_stack_client, text_model_id, inference_provider_type):
-    class AnswerFormat(BaseModel):
-        first_name: str
-        last_name: str
-        year_of_birth: int
-        num_seasons_in_nba: int
-
     response = llama_stack_client.inference.chat_completion(
         model_id=text_model_id,
         messages=[
@@ -290,11 +298,11 @@ def test_text_chat_completion_structured_output(llama_stack_client, text_model_i
         ],
         response_format={
             "type": "json_schema",
-            "json_schema": AnswerFormat.model_json_schema(),
+            "json_schema": CHAT_ANSWER_JSON_SCHEMA,
         },
         stream=False,
     )
-    answer = AnswerFormat.model_validate_json(response.completion_message.content)
+    answer = ChatAnswerFormat.model_validate_json(response.completion_message.content)
     assert answer.first_name == "Michael"
     assert answer.last_name == "Jordan"
     assert answer.year_of_birth == 1963
@@ -354,9 +362,7 @@ def test_image_chat_completion_streaming(llama_stack_client, vision_model_id):
         messages=[message],
         stream=True,
     )
-    streamed_content = ""
-    for chunk in response:
-        streamed_content += chunk.event.delta.text.lower()
+    streamed_content = "".join(chunk.event.delta.text for chunk in response).lower()
     assert len(streamed_content) > 0
     assert any(expected in streamed_content for expected in {"dog", "puppy", "pup"})
 